@@ -386,6 +386,19 @@ class Signal:
         else:
             self.comments = {None: value}
 
+    @property
+    def has_linear_transform(self) -> bool:
+        """``True`` if the raw values of the signal are scaled or offset
+        to obtain the physical values, ``False`` otherwise.
+
+        """
+        has_offset = self.offset is not None and self.offset != 0
+        has_scale = \
+            self.scale is not None \
+            and (self.scale > 1 + 1e-10 or self.scale < 1 - 1e-10)
+
+        return has_offset or has_scale
+
     def choice_string_to_number(self, string: str) -> int:
         if self.choices is None:
             raise ValueError(f"Signal {self.name} has no choices.")
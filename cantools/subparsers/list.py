@@ -1,5 +1,15 @@
 import argparse
-from typing import Any, Union
+import contextlib
+import sys
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Iterator,
+    Optional,
+    TextIO,
+    Union,
+)
 
 import cantools
 
@@ -8,204 +18,230 @@ from ..database.can.signal import NamedSignalValue
 from ..database.diagnostics.database import Database as DiagnosticsDatabase
 from .dump.formatting import signal_tree_string
 
+_SignalValue = Union[float, int, str, NamedSignalValue, None]
+_ValueFormatter = Callable[[_SignalValue, str], str]
 
-def _format_val(val: Union[float, int, str, NamedSignalValue, None],
-                unit: str,
-                value_format_specifier: str) \
-        -> str:
-    """Returns signal value formatted according to a format specifier
+
+def _make_formatter(values_format_specifier: str) -> _ValueFormatter:
+    """Returns a function which formats signal values according to a
+    format specifier
 
     e.g.
-    - ``_format_val(1.234, 'm', '%.2f')`` results in '1.23 m'
-    - ``_format_val('IAmAnEnum', 'm', '%.2f')`` results in 'IAmAnEnum'
-    - ``_format_val(1.234)`` results in '1.234'
+    - ``_make_formatter('.2f')(1.234, 'm')`` results in '1.23 m'
+    - ``_make_formatter('')('IAmAnEnum', 'm')`` results in 'IAmAnEnum'
+    - ``_make_formatter('')(1.234, '')`` results in '1.234'
     """
-    if val is None:
-        return 'None'
-    elif not unit or isinstance(val, (str, NamedSignalValue)):
-        # physical value does not exhibit a unit or is an enumeration
-        return f'{val:{value_format_specifier}}'
+    vfs = values_format_specifier
+
+    def format_value(val: _SignalValue, unit: str) -> str:
+        if val is None:
+            return 'None'
+        elif not unit or isinstance(val, (str, NamedSignalValue)):
+            # physical value does not exhibit a unit or is an enumeration
+            return f'{val:{vfs}}'
 
-    return f'{val:{value_format_specifier}} {unit}'
+        return f'{val:{vfs}} {unit}'
+
+    return format_value
 
 
 def _print_message(message: Message,
                    indent: str = '',
                    print_format_specifics: bool = True,
-                   values_format_specifier: str = '') \
-        -> None:
+                   fmt: Optional[_ValueFormatter] = None) \
+        -> Iterator[str]:
 
-    # shorten the name for the variable of the format specifier for
-    # signal values
-    vfs = values_format_specifier
+    if fmt is None:
+        fmt = _make_formatter('')
 
-    print(f'{indent}{message.name}:')
+    # the indentation prefixes of the nested output levels
+    i2 = indent + '  '
+    i4 = indent + '    '
+    i6 = indent + '      '
+    i8 = indent + '        '
 
-    if message.comments:
-        for lang in message.comments:
-            print(f'{indent}  Comment[{lang}]: {message.comments[lang]}')
+    signals = message.signals
+    autosar = message.autosar if print_format_specifics else None
+    comments = message.comments
+
+    yield f'{indent}{message.name}:\n'
+
+    if comments:
+        for lang, text in comments.items():
+            yield f'{i2}Comment[{lang}]: {text}\n'
 
     if message.bus_name:
-        print(f'{indent}  Bus: {message.bus_name}')
+        yield f'{i2}Bus: {message.bus_name}\n'
 
     if message.senders:
-        print(f'{indent}  Sending ECUs: {", ".join(sorted(message.senders))}')
+        yield f'{i2}Sending ECUs: {", ".join(sorted(message.senders))}\n'
 
     if message.header_id is None:
-        print(f'{indent}  Frame ID: 0x{message.frame_id:x} ({message.frame_id})')
+        yield f'{i2}Frame ID: 0x{message.frame_id:x} ({message.frame_id})\n'
         if message.is_container:
-            print(f'{indent}  Maximum Size: {message.length} bytes')
+            yield f'{i2}Maximum Size: {message.length} bytes\n'
         else:
-            print(f'{indent}  Size: {message.length} bytes')
-        print(f'{indent}  Is extended frame: {message.is_extended_frame}')
-        print(f'{indent}  Is CAN-FD frame: {message.is_fd}')
+            yield f'{i2}Size: {message.length} bytes\n'
+        yield f'{i2}Is extended frame: {message.is_extended_frame}\n'
+        yield f'{i2}Is CAN-FD frame: {message.is_fd}\n'
     else:
-        print(f'{indent}  Header ID: 0x{message.header_id:x} ({message.header_id})')
-        print(f'{indent}  Size: {message.length} bytes')
+        yield f'{i2}Header ID: 0x{message.header_id:x} ({message.header_id})\n'
+        yield f'{i2}Size: {message.length} bytes\n'
 
     if message.cycle_time is not None:
-        print(f'{indent}  Cycle time: {_format_val(message.cycle_time, "ms", vfs)}')
+        yield f'{i2}Cycle time: {fmt(message.cycle_time, "ms")}\n'
 
-    if print_format_specifics and message.autosar:
-        print(f'{indent}  Is network management frame: {message.autosar.is_nm}')
+    if autosar:
+        yield f'{i2}Is network management frame: {autosar.is_nm}\n'
 
-        if message.autosar.e2e:
-            e2e = message.autosar.e2e
-            print(f'{indent}  End-to-end properties:')
-            print(f'{indent}    Category: {e2e.category}')
-            print(f'{indent}    Data IDs: {e2e.data_ids}')
-            print(f'{indent}    Protected size: {e2e.payload_length} bytes')
+        e2e = autosar.e2e
+        if e2e:
+            yield f'{i2}End-to-end properties:\n'
+            yield f'{i4}Category: {e2e.category}\n'
+            yield f'{i4}Data IDs: {e2e.data_ids}\n'
+            yield f'{i4}Protected size: {e2e.payload_length} bytes\n'
 
-        print(f'{indent}  Is secured: {message.autosar.is_secured}')
-        secoc = message.autosar.secoc
+        yield f'{i2}Is secured: {autosar.is_secured}\n'
+        secoc = autosar.secoc
         if secoc:
-            print(f'{indent}  Security properties:')
-            print(f'{indent}    Authentication algorithm: {secoc.auth_algorithm_name}')
-            print(f'{indent}    Freshness algorithm: {secoc.freshness_algorithm_name}')
-            print(f'{indent}    Data ID: {secoc.data_id}')
-            print(f'{indent}    Authentication transmit bits: {secoc.auth_tx_bit_length}')
-            print(f'{indent}    Freshness counter size: {secoc.freshness_bit_length} bits')
-            print(f'{indent}    Freshness counter transmit size: {secoc.freshness_tx_bit_length} bits')
-            print(f'{indent}    Secured size: {secoc.payload_length} bytes')
-
-    if message.signals:
-        print(f'{indent}  Signal tree:')
+            yield f'{i2}Security properties:\n'
+            yield f'{i4}Authentication algorithm: {secoc.auth_algorithm_name}\n'
+            yield f'{i4}Freshness algorithm: {secoc.freshness_algorithm_name}\n'
+            yield f'{i4}Data ID: {secoc.data_id}\n'
+            yield f'{i4}Authentication transmit bits: {secoc.auth_tx_bit_length}\n'
+            yield f'{i4}Freshness counter size: {secoc.freshness_bit_length} bits\n'
+            yield f'{i4}Freshness counter transmit size: {secoc.freshness_tx_bit_length} bits\n'
+            yield f'{i4}Secured size: {secoc.payload_length} bytes\n'
+
+    if signals:
+        yield f'{i2}Signal tree:\n'
         st = signal_tree_string(message, console_width=1000*1000)
-        print()
-        for s in st.split('\n'):
-            print(f'{indent}    {s}')
-        print()
+        yield '\n'
+        # indent all lines of the tree using a single string operation
+        yield i4 + st.replace('\n', '\n' + i4) + '\n'
+        yield '\n'
 
     if message.contained_messages is not None:
-        print(f'{indent}  Potentially contained messages:')
-        print()
+        yield f'{i2}Potentially contained messages:\n'
+        yield '\n'
         for contained_message in message.contained_messages:
             if contained_message.name is not None:
-                print(f"{indent}    {contained_message.name} (0x"
-                      f"{contained_message.header_id:x})")
+                yield (f"{i4}{contained_message.name} (0x"
+                       f"{contained_message.header_id:x})\n")
             else:
-                print(f"{indent}    (0x{contained_message.header_id:x})")
-        print()
+                yield f"{i4}(0x{contained_message.header_id:x})\n"
+        yield '\n'
 
-        print(f'{indent}  Potentially contained message details:')
+        yield f'{i2}Potentially contained message details:\n'
         for contained_message in message.contained_messages:
-            _print_message(contained_message,
-                           '    ',
-                           print_format_specifics=print_format_specifics)
-
-    if message.signals:
-        print(f'{indent}  Signal details:')
+            yield from _print_message(
+                contained_message,
+                '    ',
+                print_format_specifics=print_format_specifics)
+
+    if signals:
+        yield f'{i2}Signal details:\n'
+
+    # names of the signals which are actually used as multiplexers by
+    # some other signal of the message
+    mux_names = {
+        x.multiplexer_signal
+        for x in signals
+        if x.multiplexer_signal is not None
+    }
+
+    for signal in signals:
+        choices = signal.choices
+        mux_ids = signal.multiplexer_ids
+        sig_comments = signal.comments
 
-    for signal in message.signals:
-        signal_type = 'Integer'
         if signal.is_float:
             signal_type = 'Float'
-        elif signal.is_multiplexer and \
-             signal.name in \
-                 [ x.multiplexer_signal for x in message.signals]:
-                signal_type = 'Multiplex Selector'
-
-        print(f'{indent}    {signal.name}:')
-        if signal.comments is not None:
-            for lang in signal.comments:
-                print(f'{indent}      Comment[{lang}]: {signal.comments[lang]}')
+        elif signal.is_multiplexer and signal.name in mux_names:
+            signal_type = 'Multiplex Selector'
+        else:
+            signal_type = 'Integer'
+
+        yield f'{i4}{signal.name}:\n'
+        if sig_comments is not None:
+            for lang, text in sig_comments.items():
+                yield f'{i6}Comment[{lang}]: {text}\n'
         if signal.receivers:
-            print(f'{indent}      Receiving ECUs: {", ".join(sorted(signal.receivers))}')
-        print(f'{indent}      Internal type: {signal_type}')
+            yield f'{i6}Receiving ECUs: {", ".join(sorted(signal.receivers))}\n'
+        yield f'{i6}Internal type: {signal_type}\n'
         if signal.multiplexer_signal is not None:
-            print(f'{indent}      Selector signal: {signal.multiplexer_signal}')
+            yield f'{i6}Selector signal: {signal.multiplexer_signal}\n'
             selector_sig = None
             selector_sig = message.get_signal_by_name(signal.multiplexer_signal)
             selector_values = []
 
-            if isinstance(signal.multiplexer_ids, list):
-                for x in signal.multiplexer_ids:
+            if isinstance(mux_ids, list):
+                for x in mux_ids:
                     if selector_sig.choices and x in selector_sig.choices:
                         selector_values.append(f'{selector_sig.choices[x]}')
                     else:
                         selector_values.append(f'{x}')
 
-            print(f'{indent}      Selector values: {", ".join(selector_values)}')
+            yield f'{i6}Selector values: {", ".join(selector_values)}\n'
 
-        print(f'{indent}      Start bit: {signal.start}')
-        print(f'{indent}      Length: {signal.length} bits')
-        print(f'{indent}      Byte order: {signal.byte_order}')
+        yield f'{i6}Start bit: {signal.start}\n'
+        yield f'{i6}Length: {signal.length} bits\n'
+        yield f'{i6}Byte order: {signal.byte_order}\n'
         unit = ''
         if signal.unit:
-            print(f'{indent}      Unit: {signal.unit}')
+            yield f'{i6}Unit: {signal.unit}\n'
             unit = f'{signal.unit}'
         if signal.initial is not None:
-            print(f'{indent}      Initial value: {_format_val(signal.initial, unit, vfs)}')
+            yield f'{i6}Initial value: {fmt(signal.initial, unit)}\n'
         if signal.invalid is not None:
-            print(f'{indent}      Invalid value: {_format_val(signal.invalid, unit, vfs)}')
+            yield f'{i6}Invalid value: {fmt(signal.invalid, unit)}\n'
         if signal.is_signed is not None:
-            print(f'{indent}      Is signed: {signal.is_signed}')
+            yield f'{i6}Is signed: {signal.is_signed}\n'
         if signal.minimum is not None:
-            print(f'{indent}      Minimum: {_format_val(signal.minimum, unit, vfs)}')
+            yield f'{i6}Minimum: {fmt(signal.minimum, unit)}\n'
         if signal.maximum is not None:
-            print(f'{indent}      Maximum: {_format_val(signal.maximum, unit, vfs)}')
+            yield f'{i6}Maximum: {fmt(signal.maximum, unit)}\n'
 
-        has_offset = signal.offset is not None and signal.offset != 0
-        has_scale = \
-            signal.scale is not None \
-            and (signal.scale > 1 + 1e-10 or signal.scale < 1 - 1e-10)
-        if has_offset or has_scale:
+        if signal.has_linear_transform:
             offset = signal.offset if signal.offset is not None else 0
-            print(f'{indent}      Offset: {_format_val(offset, unit, vfs)}')
+            yield f'{i6}Offset: {fmt(offset, unit)}\n'
 
             scale = signal.scale if signal.scale is not None else 1
-            print(f'{indent}      Scaling factor: {_format_val(scale, unit, vfs)}')
-
-        if signal.choices:
-            print(f'{indent}      Named values:')
-            for value, choice in signal.choices.items():
-                print(f'{indent}        {value}: {choice}')
+            yield f'{i6}Scaling factor: {fmt(scale, unit)}\n'
+
+        if choices:
+            # enumerated signals may exhibit lots of named values, so
+            # the block describing them is emitted as a single string
+            lines = [f'{i6}Named values:']
+            for value, choice in choices.items():
+                lines.append(f'{i8}{value}: {choice}')
                 if isinstance(choice, NamedSignalValue):
-                    for lang, description in choice.comments.items():
-                        print(f'{indent}          Comment[{lang}]: {description}')
+                    lines.extend(f'{i8}  Comment[{lang}]: {description}'
+                                 for lang, description in choice.comments.items())
+            yield '\n'.join(lines) + '\n'
 
-def _print_node(node: Node) -> None:
-    print(f'{node.name}:')
+def _print_node(node: Node) -> Iterator[str]:
+    yield f'{node.name}:\n'
 
     if node.comments:
-        for lang in node.comments:
-            print(f'  Comment[{lang}]: {node.comments[lang]}')
+        for lang, text in node.comments.items():
+            yield f'  Comment[{lang}]: {text}\n'
 
-def _print_bus(bus: Bus) -> None:
-    print(f'{bus.name}:')
+def _print_bus(bus: Bus) -> Iterator[str]:
+    yield f'{bus.name}:\n'
 
     if bus.comments:
-        for lang in bus.comments:
-            print(f'  Comment[{lang}]: {bus.comments[lang]}')
+        for lang, text in bus.comments.items():
+            yield f'  Comment[{lang}]: {text}\n'
 
     if bus.baudrate is not None:
-        print(f'  Baudrate: {bus.baudrate}')
+        yield f'  Baudrate: {bus.baudrate}\n'
 
     if bus.fd_baudrate is not None:
-        print(f'  CAN-FD enabled: True')
-        print(f'  FD Baudrate: {bus.fd_baudrate}')
+        yield f'  CAN-FD enabled: True\n'
+        yield f'  FD Baudrate: {bus.fd_baudrate}\n'
     else:
-        print(f'  CAN-FD enabled: False')
+        yield f'  CAN-FD enabled: False\n'
 
 def _do_list(args: Any, values_format_specifier: str='') -> None:
     input_file_name = args.input_file_name[0]
@@ -213,6 +249,7 @@ def _do_list(args: Any, values_format_specifier: str='') -> None:
     no_strict = args.no_strict
     print_buses = args.print_buses
     print_nodes = args.print_nodes
+    output_file = args.output_file
 
     can_db = cantools.database.load_file(input_file_name,
                                          prune_choices=prune,
@@ -223,85 +260,90 @@ def _do_list(args: Any, values_format_specifier: str='') -> None:
               'files!')
         return
 
-    if print_buses:
-        _do_list_buses(can_db, args)
-    elif print_nodes:
-        _do_list_nodes(can_db, args)
+    # when writing to a file, use a large buffer to avoid issuing a
+    # system call for each line of output
+    output_context: ContextManager[TextIO]
+    if output_file is None:
+        output_context = contextlib.nullcontext(sys.stdout)
     else:
-        _do_list_messages(can_db, args, values_format_specifier)
+        output_context = open(output_file, 'w', buffering=1 << 20)
+
+    with output_context as output:
+        if print_buses:
+            _do_list_buses(can_db, args, output)
+        elif print_nodes:
+            _do_list_nodes(can_db, args, output)
+        else:
+            _do_list_messages(can_db,
+                              args,
+                              values_format_specifier,
+                              output)
 
 def _do_list_buses(can_db: Database,
-                   args: Any) -> None:
+                   args: Any,
+                   output: TextIO) -> None:
     bus_names = args.items
 
     for bus in can_db.buses:
         if bus_names and bus.name not in bus_names:
             continue
 
-        _print_bus(bus)
+        output.writelines(_print_bus(bus))
 
 def _do_list_nodes(can_db: Database,
-                   args: Any) -> None:
+                   args: Any,
+                   output: TextIO) -> None:
     node_names = args.items
 
     for node in can_db.nodes:
         if node_names and node.name not in node_names:
             continue
 
-        _print_node(node)
+        output.writelines(_print_node(node))
 
 def _do_list_messages(can_db: Database,
                       args: Any,
-                      values_format_specifier: str) -> None:
+                      values_format_specifier: str,
+                      output: TextIO) -> None:
     message_names = args.items
     print_all = args.print_all
     exclude_extended = args.exclude_extended
     exclude_normal = args.exclude_normal
     print_format_specifics = not args.skip_format_specifics
+    fmt = _make_formatter(values_format_specifier)
+
+    if print_all or not message_names:
+        # collect the names of all messages in the database. this is
+        # either needed to print the details of all of them or to
+        # print the list of messages if none have been specified
+        message_names = sorted(message_names + [
+            message.name
+            for message in can_db.messages
+            if not (exclude_extended if message.is_extended_frame
+                    else exclude_normal)
+        ])
+
+        if not print_all:
+            # if no messages have been specified, we print the list of
+            # messages in the database
+            output.writelines(f'{message_name}\n'
+                              for message_name in message_names)
+
+            return
+
+    # if a list of messages has been specified, the details of these
+    # are printed.
+    for message_name in message_names:
+        try:
+            message = can_db.get_message_by_name(message_name)
+        except KeyError:
+            print(f'No message named "{message_name}" has been found in input file.')
+            continue
 
-    if print_all:
-        # if no messages have been specified, we print the list of
-        # messages in the database
-        for message in can_db.messages:
-            if message.is_extended_frame and exclude_extended:
-                continue
-            if not message.is_extended_frame and exclude_normal:
-                continue
-            message_names.append(message.name)
-
-        message_names.sort()
-
-    if not message_names:
-        # if no messages have been specified, we print the list of
-        # messages in the database
-        message_names = []
-        for message in can_db.messages:
-            if message.is_extended_frame and exclude_extended:
-                continue
-            if not message.is_extended_frame and exclude_normal:
-                continue
-
-            message_names.append(message.name)
-
-        message_names.sort()
-        for message_name in message_names:
-            print(message_name)
-
-        return
-    else:
-        # if a list of messages has been specified, the details of these
-        # are printed.
-        for message_name in message_names:
-            try:
-                message = can_db.get_message_by_name(message_name)
-            except KeyError:
-                print(f'No message named "{message_name}" has been found in input file.')
-                continue
-
+        output.writelines(
             _print_message(message,
                            print_format_specifics=print_format_specifics,
-                           values_format_specifier=values_format_specifier)
-
+                           fmt=fmt))
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
@@ -367,6 +409,9 @@ def add_subparser(subparsers: argparse._SubParsersAction) -> None:
         '--no-strict',
         action='store_true',
         help='Skip database consistency checks.')
+    list_parser.add_argument(
+        '-o', '--output-file',
+        help='A file to write the output to instead of printing it.')
     list_parser.add_argument('input_file_name', metavar='FILE', nargs=1)
     list_parser.add_argument(
         'items',
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import filecmp
 import os
 import shutil
 import tempfile
@@ -9,27 +10,37 @@ from unittest import mock
 
 import cantools
 
+TEST_DIR = os.path.dirname(__file__)
+
 
 class CanToolsConvertFullTest(unittest.TestCase):
 
-    SYM_FILE_COMMENTS_HEX_AND_MOTOROLA = os.path.join(os.path.split(__file__)[0], 'files', 'sym', 'comments_hex_and_motorola.sym')
-    DBC_FILE_COMMENTS_HEX_AND_MOTOROLA = os.path.join(os.path.split(__file__)[0], 'files', 'dbc', 'comments_hex_and_motorola_converted_from_sym.dbc')
+    SYM_FILE_COMMENTS_HEX_AND_MOTOROLA = os.path.join(TEST_DIR, 'files', 'sym', 'comments_hex_and_motorola.sym')
+    DBC_FILE_COMMENTS_HEX_AND_MOTOROLA = os.path.join(TEST_DIR, 'files', 'dbc', 'comments_hex_and_motorola_converted_from_sym.dbc')
 
     maxDiff = None
 
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir)
+
     # ------- aux functions -------
 
     def get_test_file_name(self, fn):
-        return os.path.join(os.path.split(__file__)[0], 'files', *fn.split('/'))
+        return os.path.join(TEST_DIR, 'files', *fn.split('/'))
 
     def get_out_file_name(self, fn_in, ext):
-        fn = fn_in
-        fn = os.path.splitext(fn)[0] + ext
-        fn = os.path.split(fn)[1]
-        fn = os.path.join(tempfile.mkdtemp(), fn)
-        return fn
+        fn = os.path.splitext(os.path.basename(fn_in))[0] + ext
+        return os.path.join(self.out_dir, fn)
 
     def assertFileEqual(self, fn1, fn2, encoding=None):
+        if filecmp.cmp(fn1, fn2, shallow=False):
+            return
+
+        # compare line by line to ignore different line endings and
+        # to get a readable diff if the files do differ
         with open(fn1, 'rt', encoding=encoding) as f:
             content1 = list(f)
         with open(fn2, 'rt', encoding=encoding) as f:
@@ -41,15 +52,17 @@ class CanToolsConvertFullTest(unittest.TestCase):
         signal_attributes = ("name", "start", "length", "byte_order", "is_signed", "is_float",
                              "initial", "scale", "offset", "minimum", "maximum", "unit", "comment",
                              "choices", "is_multiplexer", "multiplexer_ids", "multiplexer_signal")
+        message_attributes = [a for a in message_attributes if a not in ignore_message_attributes]
+        signal_attributes = [a for a in signal_attributes if a not in ignore_signal_attributes]
+        get_message_attributes = lambda msg: {a: getattr(msg, a) for a in message_attributes}
+        get_signal_attributes = lambda sig: {a: getattr(sig, a) for a in signal_attributes}
         self.assertEqual(len(db1.messages), len(db2.messages))
         for i in range(len(db1.messages)):
             msg1 = db1.messages[i]
             msg2 = db2.messages[i]
-            for a in message_attributes:
-                if a in ignore_message_attributes:
-                    continue
-                #print(f"msg.{a}".ljust(30) + str(getattr(msg1, a)).ljust(10) + " == %s" % getattr(msg2, a))
-                self.assertEqual(getattr(msg1, a), getattr(msg2, a), "%s does not match for message %s" % (a, i))
+            self.assertEqual(get_message_attributes(msg1),
+                             get_message_attributes(msg2),
+                             f"attributes do not match for message {i}")
 
             self.assertEqual(len(msg1.signals), len(msg2.signals))
             if ignore_order_of_signals:
@@ -57,17 +70,9 @@ class CanToolsConvertFullTest(unittest.TestCase):
             else:
                 sort = lambda signals: signals
             for sig1, sig2 in zip(sort(msg1.signals), sort(msg2.signals)):
-                for a in signal_attributes:
-                    if a in ignore_signal_attributes:
-                        continue
-                    #print("    "+f"sig.{a}".ljust(30) + str(getattr(sig1, a)).ljust(10) + " == %s" % getattr(sig2, a))
-                    self.assertEqual(getattr(sig1, a), getattr(sig2, a), "%s does not match for signal %s in message %s" % (a, sig1.name, msg1.name))
-
-                #print()
-
-    def remove_out_file(self, fn_out):
-        path = os.path.split(fn_out)[0]
-        shutil.rmtree(path)
+                self.assertEqual(get_signal_attributes(sig1),
+                                 get_signal_attributes(sig2),
+                                 f"attributes do not match for signal {sig1.name} in message {msg1.name}")
 
     # ------- dump, load, dump produces same output -------
 
@@ -80,7 +85,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db, fn_out)
 
         self.assertFileEqual(fn_expected_output, fn_out)
-        self.remove_out_file(fn_out)
 
     # ------- sort_signals when dumping to dbc files -------
 
@@ -94,7 +98,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db, fn_out, sort_signals=sort_signals)
 
         self.assertFileEqual(fn_expected_output, fn_out)
-        self.remove_out_file(fn_out)
 
     def test_dbc_dump_default_sort_signals(self):
         fn_in = self.get_test_file_name('dbc/socialledge-written-by-cantools.dbc')
@@ -105,7 +108,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db, fn_out)
 
         self.assertFileEqual(fn_expected_output, fn_out)
-        self.remove_out_file(fn_out)
 
     def test_dbc_dump_default_sort_signals2(self):
         fn_in = self.get_test_file_name('dbc/vehicle.dbc')
@@ -125,8 +127,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db2, fn_out2)
 
         self.assertFileEqual(fn_out1, fn_out2, encoding='cp1252')
-        self.remove_out_file(fn_out1)
-        self.remove_out_file(fn_out2)
 
     # ------- sort_signals when dumping to kcd files -------
 
@@ -140,7 +140,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db, fn_out)
         dumped_db = cantools.database.load_file(fn_out, prune_choices=False, sort_signals=None)
         self.assertDatabaseEqual(db, dumped_db)
-        self.remove_out_file(fn_out)
 
         for msg in db.messages:
             msg.signals.sort(key=lambda sig: sig.name)
@@ -149,7 +148,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         cantools.database.dump_file(db, fn_out)
         dumped_db = cantools.database.load_file(fn_out, prune_choices=False, sort_signals=None)
         self.assertDatabaseEqual(db, dumped_db)
-        self.remove_out_file(fn_out)
 
     def test_kcd_dump_sort_signals_by_name(self):
         # test that signals are sorted by name if requested when dumping to a kcd file
@@ -166,7 +164,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
 
         db_dumped = cantools.database.load_file(fn_out, prune_choices=False, sort_signals=None)
         self.assertDatabaseEqual(db, db_dumped)
-        self.remove_out_file(fn_out)
 
     # ------- test sym -> dbc -------
 
@@ -182,8 +179,6 @@ class CanToolsConvertFullTest(unittest.TestCase):
         fn_expected_output = dbc
         self.assertFileEqual(fn_expected_output, fn_out)
 
-        self.remove_out_file(fn_out)
-
     def test_sym_to_dbc__compare_databases(self):
         sym = self.SYM_FILE_COMMENTS_HEX_AND_MOTOROLA
         dbc = self.DBC_FILE_COMMENTS_HEX_AND_MOTOROLA
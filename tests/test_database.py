@@ -4015,6 +4015,20 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          'The signal S does not fit in message M.')
 
+    def test_signal_has_linear_transform(self):
+        signal = cantools.database.can.Signal('S', 0, 8)
+        self.assertFalse(signal.has_linear_transform)
+
+        signal.scale = 1 + 1e-12
+        self.assertFalse(signal.has_linear_transform)
+
+        signal.scale = 0.5
+        self.assertTrue(signal.has_linear_transform)
+
+        signal.scale = 1
+        signal.offset = -40
+        self.assertTrue(signal.has_linear_transform)
+
     def test_add_two_dbc_files(self):
         """Test adding two DBC-files to the same database.
 
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 import traceback
 
@@ -12,6 +14,7 @@ except ImportError:
 
 import can
 import cantools.subparsers.list as list_module
+from cantools.database.can.signal import NamedSignalValue
 
 try:
     from StringIO import StringIO
@@ -30,6 +33,7 @@ class Args(object):
         self.input_file_name = (input_file_name, )
         self.print_buses = False
         self.print_nodes = False
+        self.output_file = None
         self.items = []
 
 class CanToolsListTest(unittest.TestCase):
@@ -731,5 +735,36 @@ Message3:
             actual_output = stdout.getvalue()
             self.assertEqual(actual_output, expected_output)
 
+    def test_output_file(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            args = Args('tests/files/dbc/motohawk.dbc')
+            args.output_file = os.path.join(out_dir, 'motohawk.txt')
+
+            stdout = StringIO()
+            with patch('sys.stdout', stdout):
+                list_module._do_list(args)
+
+            self.assertEqual(stdout.getvalue(), '')
+
+            with open(args.output_file) as fin:
+                self.assertEqual(fin.read(), 'ExampleMessage\n')
+
+    def test_format_values(self):
+        fmt = list_module._make_formatter('')
+        self.assertEqual(fmt(1.234, ''), '1.234')
+        self.assertEqual(fmt(1.234, 'm'), '1.234 m')
+        self.assertEqual(fmt('IAmAnEnum', 'm'), 'IAmAnEnum')
+        self.assertEqual(fmt(NamedSignalValue(1, 'one'), 'm'), 'one')
+        self.assertEqual(fmt(type('MyStr', (str, ), {})('IAmAnEnum'), 'm'),
+                         'IAmAnEnum')
+        self.assertEqual(fmt(True, 'm'), 'True m')
+        self.assertEqual(fmt(None, 'm'), 'None')
+
+        fmt = list_module._make_formatter('.2f')
+        self.assertEqual(fmt(1.234, ''), '1.23')
+        self.assertEqual(fmt(1.234, 'm'), '1.23 m')
+        self.assertEqual(fmt(3, 'ms'), '3.00 ms')
+        self.assertEqual(fmt(None, 'm'), 'None')
+
 if __name__ == '__main__':
     unittest.main()